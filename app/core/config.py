@@ -1,12 +1,142 @@
-from pydantic_settings import BaseSettings
-from typing import Optional
-from functools import lru_cache
+from pydantic_settings import (
+    BaseSettings,
+    EnvSettingsSource,
+    PydanticBaseSettingsSource,
+    SettingsConfigDict,
+)
+from typing import Dict, Mapping, Optional, Tuple, Type
+from functools import cached_property, lru_cache
+import importlib
+import importlib.util
+import logging
+import os
 
+logger = logging.getLogger(__name__)
 
-class Settings(BaseSettings):
+FROZEN_ENV_MODULE = "app.core._env_frozen"
+
+
+@lru_cache(maxsize=4)
+def load_frozen_env(env_file: str) -> Optional[Dict[str, str]]:
+    """
+    Load the snapshot written by scripts/freeze_env.py.
+    
+    Returns None when there is no snapshot or when env_file has been edited
+    since it was generated, so a stale snapshot never shadows .env.
+    """
+    spec = importlib.util.find_spec(FROZEN_ENV_MODULE)
+    if spec is None or spec.origin is None:
+        return None
+    
+    if os.path.isfile(env_file) and os.path.getmtime(env_file) > os.path.getmtime(spec.origin):
+        logger.warning("Ignoring stale frozen env %s; %s is newer", spec.origin, env_file)
+        return None
+    
+    logger.info("Loading settings from frozen env %s", spec.origin)
+    return importlib.import_module(FROZEN_ENV_MODULE).ENV
+
+
+class FrozenEnvSettingsSource(EnvSettingsSource):
+    """Settings source backed by the dict written by scripts/freeze_env.py"""
+    
+    def __init__(self, settings_cls: Type[BaseSettings], env: Dict[str, str]) -> None:
+        self.frozen_env = env
+        super().__init__(settings_cls)
+    
+    def _load_env_vars(self) -> Mapping[str, Optional[str]]:
+        if self.case_sensitive:
+            return self.frozen_env
+        return {key.lower(): value for key, value in self.frozen_env.items()}
+
+
+class EnvBaseSettings(BaseSettings):
+    """Shared env/.env loading for the application settings and its groups"""
+    
+    model_config = SettingsConfigDict(
+        env_file=".env",
+        env_file_encoding="utf-8",
+        case_sensitive=True,
+        extra="ignore",
+    )
+    
+    @classmethod
+    def settings_customise_sources(
+        cls,
+        settings_cls: Type[BaseSettings],
+        init_settings: PydanticBaseSettingsSource,
+        env_settings: PydanticBaseSettingsSource,
+        dotenv_settings: PydanticBaseSettingsSource,
+        file_secret_settings: PydanticBaseSettingsSource,
+    ) -> Tuple[PydanticBaseSettingsSource, ...]:
+        """
+        Use the frozen .env snapshot when one has been generated at deploy time.
+        Falls back to parsing the .env file when it is missing or stale.
+        """
+        frozen_env = load_frozen_env(str(settings_cls.model_config.get("env_file") or ".env"))
+        if frozen_env is None:
+            return init_settings, env_settings, dotenv_settings, file_secret_settings
+        
+        frozen_settings = FrozenEnvSettingsSource(settings_cls, frozen_env)
+        return init_settings, env_settings, frozen_settings, file_secret_settings
+
+
+class RedisSettings(EnvBaseSettings):
+    """Redis settings (Optional), read from REDIS_* variables"""
+    
+    model_config = SettingsConfigDict(env_prefix="REDIS_")
+    
+    URL: Optional[str] = None
+    CACHE_TTL: int = 300
+
+
+class SmtpSettings(EnvBaseSettings):
+    """Email settings (Optional), read from SMTP_* variables"""
+    
+    model_config = SettingsConfigDict(env_prefix="SMTP_")
+    
+    HOST: Optional[str] = None
+    PORT: Optional[int] = 587
+    USER: Optional[str] = None
+    PASSWORD: Optional[str] = None
+    FROM_EMAIL: Optional[str] = None
+    FROM_NAME: Optional[str] = None
+
+
+class AwsSettings(EnvBaseSettings):
+    """AWS settings (Optional), read from AWS_* variables"""
+    
+    model_config = SettingsConfigDict(env_prefix="AWS_")
+    
+    ACCESS_KEY_ID: Optional[str] = None
+    SECRET_ACCESS_KEY: Optional[str] = None
+    REGION: Optional[str] = "us-east-1"
+    S3_BUCKET: Optional[str] = None
+
+
+class SentrySettings(EnvBaseSettings):
+    """Sentry settings (Optional), read from SENTRY_* variables"""
+    
+    model_config = SettingsConfigDict(env_prefix="SENTRY_")
+    
+    DSN: Optional[str] = None
+    ENVIRONMENT: Optional[str] = None
+    TRACES_SAMPLE_RATE: float = 0.1
+
+
+class CelerySettings(EnvBaseSettings):
+    """Worker settings (Optional), read from CELERY_* variables"""
+    
+    model_config = SettingsConfigDict(env_prefix="CELERY_")
+    
+    BROKER_URL: Optional[str] = None
+    RESULT_BACKEND: Optional[str] = None
+
+
+class Settings(EnvBaseSettings):
     # Application Settings
     APP_NAME: str = "FastAPI Application"
     APP_VERSION: str = "1.0.0"
+    APP_DESCRIPTION: str = ""
     DEBUG: bool = False
     ENVIRONMENT: str = "production"
     
@@ -15,12 +145,13 @@ class Settings(BaseSettings):
     ALGORITHM: str = "HS256"
     ACCESS_TOKEN_EXPIRE_MINUTES: int = 30
     REFRESH_TOKEN_EXPIRE_DAYS: int = 7
+    PASSWORD_HASH_ROUNDS: int = 12
     
     # Database Settings
     DATABASE_URL: str
     DB_ECHO: bool = False
-    DB_POOL_SIZE: int = 5
-    DB_MAX_OVERFLOW: int = 10
+    DB_POOL_SIZE: int = 10
+    DB_MAX_OVERFLOW: int = 20
     DB_POOL_TIMEOUT: int = 30
     DB_POOL_RECYCLE: int = 3600
     
@@ -39,43 +170,16 @@ class Settings(BaseSettings):
     DEFAULT_PAGE_SIZE: int = 20
     MAX_PAGE_SIZE: int = 100
     
-    # Redis Settings (Optional)
-    REDIS_URL: Optional[str] = None
-    REDIS_CACHE_TTL: int = 300
-    
-    # Email Settings (Optional)
-    SMTP_HOST: Optional[str] = None
-    SMTP_PORT: Optional[int] = 587
-    SMTP_USER: Optional[str] = None
-    SMTP_PASSWORD: Optional[str] = None
-    SMTP_FROM_EMAIL: Optional[str] = None
-    SMTP_FROM_NAME: Optional[str] = None
-    
-    # AWS Settings (Optional)
-    AWS_ACCESS_KEY_ID: Optional[str] = None
-    AWS_SECRET_ACCESS_KEY: Optional[str] = None
-    AWS_REGION: Optional[str] = "us-east-1"
-    AWS_S3_BUCKET: Optional[str] = None
-    
     # Logging Settings
     LOG_LEVEL: str = "INFO"
     LOG_FORMAT: str = "json"
     LOG_FILE: Optional[str] = None
     
-    # Sentry Settings (Optional)
-    SENTRY_DSN: Optional[str] = None
-    SENTRY_ENVIRONMENT: Optional[str] = None
-    SENTRY_TRACES_SAMPLE_RATE: float = 0.1
-    
     # File Upload Settings
     MAX_UPLOAD_SIZE: int = 10485760  # 10MB
-    ALLOWED_UPLOAD_EXTENSIONS: list[str] = [".jpg", ".jpeg", ".png", ".pdf", ".doc", ".docx"]
+    ALLOWED_UPLOAD_EXTENSIONS: frozenset[str] = frozenset({".jpg", ".jpeg", ".png", ".pdf", ".doc", ".docx"})
     UPLOAD_DIR: str = "uploads"
     
-    # Worker Settings
-    CELERY_BROKER_URL: Optional[str] = None
-    CELERY_RESULT_BACKEND: Optional[str] = None
-    
     # Feature Flags
     ENABLE_REGISTRATION: bool = True
     ENABLE_EMAIL_VERIFICATION: bool = True
@@ -87,11 +191,31 @@ class Settings(BaseSettings):
     PROMETHEUS_ENABLED: bool = False
     PROMETHEUS_PORT: int = 9090
     
-    class Config:
-        env_file = ".env"
-        env_file_encoding = "utf-8"
-        case_sensitive = True
-        extra = "ignore"
+    # Optional groups are only loaded and validated on first access
+    @cached_property
+    def redis(self) -> RedisSettings:
+        """Redis settings group"""
+        return RedisSettings()
+    
+    @cached_property
+    def smtp(self) -> SmtpSettings:
+        """Email settings group"""
+        return SmtpSettings()
+    
+    @cached_property
+    def aws(self) -> AwsSettings:
+        """AWS settings group"""
+        return AwsSettings()
+    
+    @cached_property
+    def sentry(self) -> SentrySettings:
+        """Sentry settings group"""
+        return SentrySettings()
+    
+    @cached_property
+    def celery(self) -> CelerySettings:
+        """Worker settings group"""
+        return CelerySettings()
     
     def get_database_url(self) -> str:
         """Get the database URL with proper formatting"""
@@ -110,7 +234,7 @@ class Settings(BaseSettings):
         return self.ENVIRONMENT.lower() == "testing"
 
 
-@lru_cache()
+@lru_cache(maxsize=1)
 def get_settings() -> Settings:
     """
     Get cached settings instance.
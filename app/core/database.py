@@ -4,17 +4,19 @@ from sqlalchemy.ext.asyncio import (
     create_async_engine,
     async_sessionmaker,
 )
-from sqlalchemy.orm import declarative_base
+from sqlalchemy.orm import DeclarativeBase
 from app.core.config import settings
 
 # Create async engine
 engine = create_async_engine(
     settings.DATABASE_URL,
-    echo=settings.DEBUG,
+    echo=settings.DB_ECHO,
     future=True,
     pool_pre_ping=True,
-    pool_size=10,
-    max_overflow=20,
+    pool_size=settings.DB_POOL_SIZE,
+    max_overflow=settings.DB_MAX_OVERFLOW,
+    pool_timeout=settings.DB_POOL_TIMEOUT,
+    pool_recycle=settings.DB_POOL_RECYCLE,
 )
 
 # Create async session factory
@@ -27,7 +29,8 @@ async_session_maker = async_sessionmaker(
 )
 
 # Create declarative base
-Base = declarative_base()
+class Base(DeclarativeBase):
+    """Declarative base for ORM models (use Mapped[...] / mapped_column)"""
 
 
 async def get_async_session() -> AsyncGenerator[AsyncSession, None]:
@@ -39,16 +42,18 @@ async def get_async_session() -> AsyncGenerator[AsyncSession, None]:
         async def get_items(session: AsyncSession = Depends(get_async_session)):
             result = await session.execute(select(Item))
             return result.scalars().all()
+    
+    The session is never committed implicitly. Endpoints that write must
+    commit before returning, so constraint errors reach the exception
+    handlers instead of surfacing after the response is sent:
+    
+        @app.post("/items")
+        async def create_item(session: AsyncSession = Depends(get_async_session)):
+            session.add(Item(...))
+            await session.commit()
     """
     async with async_session_maker() as session:
-        try:
-            yield session
-            await session.commit()
-        except Exception:
-            await session.rollback()
-            raise
-        finally:
-            await session.close()
+        yield session
 
 
 async def init_db() -> None:
@@ -1,34 +1,21 @@
 # app/core/deps.py
-from typing import Generator, Optional
+from typing import Optional
 from fastapi import Depends, HTTPException, status
 from fastapi.security import OAuth2PasswordBearer
-from jose import jwt, JWTError
-from sqlalchemy.orm import Session
+from sqlalchemy.ext.asyncio import AsyncSession
 from pydantic import ValidationError
 
 from app.core.config import settings
-from app.core.security import ALGORITHM
-from app.db.session import SessionLocal
+from app.core.security import credentials_exception, verify_access_token
+from app.core.database import get_async_session
 from app.models.user import User
 from app.schemas.token import TokenPayload
 
-oauth2_scheme = OAuth2PasswordBearer(tokenUrl=f"{settings.API_V1_STR}/auth/login")
+oauth2_scheme = OAuth2PasswordBearer(tokenUrl=f"{settings.API_V1_PREFIX}/auth/login")
 
 
-def get_db() -> Generator:
-    """
-    Database dependency that yields a SQLAlchemy session.
-    Automatically closes the session after the request is complete.
-    """
-    db = SessionLocal()
-    try:
-        yield db
-    finally:
-        db.close()
-
-
-def get_current_user(
-    db: Session = Depends(get_db),
+async def get_current_user(
+    db: AsyncSession = Depends(get_async_session),
     token: str = Depends(oauth2_scheme)
 ) -> User:
     """
@@ -44,32 +31,24 @@ def get_current_user(
     Raises:
         HTTPException: If token is invalid or user not found
     """
-    credentials_exception = HTTPException(
-        status_code=status.HTTP_401_UNAUTHORIZED,
-        detail="Could not validate credentials",
-        headers={"WWW-Authenticate": "Bearer"},
-    )
+    # Rejects invalid, expired and non-access tokens with a 401
+    payload = verify_access_token(token)
     
     try:
-        payload = jwt.decode(
-            token, 
-            settings.SECRET_KEY, 
-            algorithms=[ALGORITHM]
-        )
         token_data = TokenPayload(**payload)
         
         if token_data.sub is None:
-            raise credentials_exception
+            raise credentials_exception()
             
         user_id: int = int(token_data.sub)
         
-    except (JWTError, ValidationError, ValueError):
-        raise credentials_exception
+    except (ValidationError, ValueError):
+        raise credentials_exception()
     
-    user = db.query(User).filter(User.id == user_id).first()
+    user = await db.get(User, user_id)
     
     if user is None:
-        raise credentials_exception
+        raise credentials_exception()
     
     if not user.is_active:
         raise HTTPException(
@@ -80,7 +59,7 @@ def get_current_user(
     return user
 
 
-def get_current_active_user(
+async def get_current_active_user(
     current_user: User = Depends(get_current_user),
 ) -> User:
     """
@@ -103,7 +82,7 @@ def get_current_active_user(
     return current_user
 
 
-def get_current_superuser(
+async def get_current_superuser(
     current_user: User = Depends(get_current_user),
 ) -> User:
     """
@@ -126,8 +105,8 @@ def get_current_superuser(
     return current_user
 
 
-def get_optional_current_user(
-    db: Session = Depends(get_db),
+async def get_optional_current_user(
+    db: AsyncSession = Depends(get_async_session),
     token: Optional[str] = Depends(oauth2_scheme)
 ) -> Optional[User]:
     """
@@ -145,11 +124,7 @@ def get_optional_current_user(
         return None
     
     try:
-        payload = jwt.decode(
-            token,
-            settings.SECRET_KEY,
-            algorithms=[ALGORITHM]
-        )
+        payload = verify_access_token(token)
         token_data = TokenPayload(**payload)
         
         if token_data.sub is None:
@@ -157,10 +132,10 @@ def get_optional_current_user(
             
         user_id: int = int(token_data.sub)
         
-    except (JWTError, ValidationError, ValueError):
+    except (HTTPException, ValidationError, ValueError):
         return None
     
-    user = db.query(User).filter(User.id == user_id).first()
+    user = await db.get(User, user_id)
     
     if user is None or not user.is_active:
         return None
@@ -1,14 +1,25 @@
 # app/core/exceptions.py
-from typing import Any, Dict, Optional, Union
+from types import MappingProxyType
+from typing import Any, Dict, Mapping, Optional, Union
 from fastapi import HTTPException as FastAPIHTTPException, Request, status
-from fastapi.responses import JSONResponse
+from fastapi.responses import Response
 from fastapi.exceptions import RequestValidationError
+from starlette.exceptions import HTTPException as StarletteHTTPException
 from pydantic import ValidationError
 from sqlalchemy.exc import SQLAlchemyError, IntegrityError
 import logging
+import orjson
+
+from app.core.config import settings
 
 logger = logging.getLogger(__name__)
 
+# Shared by every 401 response, so read-only
+BEARER_HEADERS: Mapping[str, str] = MappingProxyType({"WWW-Authenticate": "Bearer"})
+
+# Fallback error codes for common statuses, built once
+_DEFAULT_CODES = {code: f"ERR_{code}" for code in (400, 401, 403, 404, 405, 409, 422, 500)}
+
 
 class HTTPException(FastAPIHTTPException):
     """Base HTTP exception with enhanced error details"""
@@ -17,11 +28,11 @@ class HTTPException(FastAPIHTTPException):
         self,
         status_code: int,
         detail: Any = None,
-        headers: Optional[Dict[str, str]] = None,
+        headers: Optional[Mapping[str, str]] = None,
         error_code: Optional[str] = None,
     ) -> None:
         super().__init__(status_code=status_code, detail=detail, headers=headers)
-        self.error_code = error_code or f"ERR_{status_code}"
+        self.error_code = error_code or _DEFAULT_CODES.get(status_code) or f"ERR_{status_code}"
 
 
 class NotFoundException(HTTPException):
@@ -75,7 +86,7 @@ class UnauthorizedException(HTTPException):
             status_code=status.HTTP_401_UNAUTHORIZED,
             detail=detail,
             error_code="UNAUTHORIZED",
-            headers={"WWW-Authenticate": "Bearer"},
+            headers=BEARER_HEADERS,
         )
 
 
@@ -166,7 +177,7 @@ def create_error_response(
     response = {
         "success": False,
         "error": {
-            "code": error_code or f"ERR_{status_code}",
+            "code": error_code or _DEFAULT_CODES.get(status_code) or f"ERR_{status_code}",
             "message": detail,
         }
     }
@@ -177,131 +188,185 @@ def create_error_response(
     return response
 
 
-async def http_exception_handler(request: Request, exc: HTTPException) -> JSONResponse:
-    """Global handler for HTTP exceptions"""
-    logger.warning(
-        f"HTTP exception: {exc.status_code} - {exc.detail}",
-        extra={
-            "path": request.url.path,
-            "method": request.method,
-            "error_code": getattr(exc, "error_code", None),
-        }
+# Pre-serialized bodies for handlers whose response never varies
+_INTEGRITY_ERROR_BODY = orjson.dumps(create_error_response(
+    status_code=status.HTTP_409_CONFLICT,
+    detail="Database integrity constraint violated",
+    error_code="INTEGRITY_ERROR",
+))
+_DATABASE_ERROR_BODY = orjson.dumps(create_error_response(
+    status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+    detail="Database operation failed",
+    error_code="DATABASE_ERROR",
+))
+_INTERNAL_ERROR_BODY = orjson.dumps(create_error_response(
+    status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+    detail="An unexpected error occurred",
+    error_code="INTERNAL_SERVER_ERROR",
+))
+
+# Pre-serialized bodies for HTTP exceptions raised with their default detail,
+# keyed by (status_code, error_code, detail)
+_CACHED_BODIES = {
+    (exc.status_code, getattr(exc, "error_code", None), exc.detail): orjson.dumps(
+        create_error_response(
+            status_code=exc.status_code,
+            detail=exc.detail,
+            error_code=getattr(exc, "error_code", None),
+        )
+    )
+    for exc in (
+        NotFoundException(),
+        ValidationException(),
+        UnauthorizedException(),
+        ForbiddenException(),
+        ConflictException(),
+        BadRequestException(),
+        InternalServerException(),
+        DatabaseException(),
+        *(FastAPIHTTPException(status_code=code) for code in (401, 403, 404, 405)),
     )
+}
+
+
+def _log_tracebacks() -> bool:
+    """Only format tracebacks into log records when debugging"""
+    return settings.DEBUG or logger.isEnabledFor(logging.DEBUG)
+
+
+async def http_exception_handler(
+    request: Request, exc: StarletteHTTPException
+) -> Response:
+    """Global handler for HTTP exceptions"""
+    error_code = getattr(exc, "error_code", None)
+    errors = getattr(exc, "errors", None)
     
-    return JSONResponse(
-        status_code=exc.status_code,
-        content=create_error_response(
+    if logger.isEnabledFor(logging.WARNING):
+        logger.warning(
+            "HTTP exception: %s - %s",
+            exc.status_code,
+            exc.detail,
+            extra={
+                "path": request.url.path,
+                "method": request.method,
+                "error_code": error_code,
+            }
+        )
+    
+    body = None
+    if not errors and isinstance(exc.detail, str):
+        body = _CACHED_BODIES.get((exc.status_code, error_code, exc.detail))
+    if body is None:
+        body = orjson.dumps(create_error_response(
             status_code=exc.status_code,
             detail=exc.detail,
-            error_code=getattr(exc, "error_code", None),
-            errors=getattr(exc, "errors", None),
-        ),
+            error_code=error_code,
+            errors=errors,
+        ))
+    
+    return Response(
+        content=body,
+        status_code=exc.status_code,
+        media_type="application/json",
         headers=exc.headers,
     )
 
 
 async def validation_exception_handler(
     request: Request, exc: Union[RequestValidationError, ValidationError]
-) -> JSONResponse:
+) -> Response:
     """Global handler for validation exceptions"""
-    errors = []
+    # RequestValidationError and ValidationError share the errors() shape
+    errors = [
+        {
+            "field": ".".join(map(str, error["loc"])),
+            "message": error["msg"],
+            "type": error["type"],
+        }
+        for error in exc.errors()
+    ]
     
-    if isinstance(exc, RequestValidationError):
-        for error in exc.errors():
-            errors.append({
-                "field": ".".join(str(loc) for loc in error["loc"]),
-                "message": error["msg"],
-                "type": error["type"],
-            })
-    else:
-        for error in exc.errors():
-            errors.append({
-                "field": ".".join(str(loc) for loc in error["loc"]),
-                "message": error["msg"],
-                "type": error["type"],
-            })
+    if logger.isEnabledFor(logging.WARNING):
+        logger.warning(
+            "Validation error on %s",
+            request.url.path,
+            extra={
+                "path": request.url.path,
+                "method": request.method,
+                "errors": errors,
+            }
+        )
     
-    logger.warning(
-        f"Validation error on {request.url.path}",
-        extra={
-            "path": request.url.path,
-            "method": request.method,
-            "errors": errors,
-        }
-    )
+    body = orjson.dumps(create_error_response(
+        status_code=status.HTTP_422_UNPROCESSABLE_ENTITY,
+        detail="Validation failed",
+        error_code="VALIDATION_ERROR",
+        errors=errors,
+    ))
     
-    return JSONResponse(
+    return Response(
+        content=body,
         status_code=status.HTTP_422_UNPROCESSABLE_ENTITY,
-        content=create_error_response(
-            status_code=status.HTTP_422_UNPROCESSABLE_ENTITY,
-            detail="Validation failed",
-            error_code="VALIDATION_ERROR",
-            errors=errors,
-        ),
+        media_type="application/json",
     )
 
 
 async def sqlalchemy_exception_handler(
     request: Request, exc: SQLAlchemyError
-) -> JSONResponse:
+) -> Response:
     """Global handler for SQLAlchemy exceptions"""
-    logger.error(
-        f"Database error: {str(exc)}",
-        extra={
-            "path": request.url.path,
-            "method": request.method,
-        },
-        exc_info=True,
-    )
+    if logger.isEnabledFor(logging.ERROR):
+        logger.error(
+            "Database error: %s",
+            exc,
+            extra={
+                "path": request.url.path,
+                "method": request.method,
+            },
+            exc_info=_log_tracebacks(),
+        )
     
     if isinstance(exc, IntegrityError):
-        detail = "Database integrity constraint violated"
-        error_code = "INTEGRITY_ERROR"
         status_code = status.HTTP_409_CONFLICT
+        body = _INTEGRITY_ERROR_BODY
     else:
-        detail = "Database operation failed"
-        error_code = "DATABASE_ERROR"
         status_code = status.HTTP_500_INTERNAL_SERVER_ERROR
+        body = _DATABASE_ERROR_BODY
     
-    return JSONResponse(
+    return Response(
+        content=body,
         status_code=status_code,
-        content=create_error_response(
-            status_code=status_code,
-            detail=detail,
-            error_code=error_code,
-        ),
+        media_type="application/json",
     )
 
 
-async def generic_exception_handler(request: Request, exc: Exception) -> JSONResponse:
+async def generic_exception_handler(request: Request, exc: Exception) -> Response:
     """Global handler for unhandled exceptions"""
-    logger.error(
-        f"Unhandled exception: {str(exc)}",
-        extra={
-            "path": request.url.path,
-            "method": request.method,
-            "exception_type": type(exc).__name__,
-        },
-        exc_info=True,
-    )
+    if logger.isEnabledFor(logging.ERROR):
+        logger.error(
+            "Unhandled exception: %s",
+            exc,
+            extra={
+                "path": request.url.path,
+                "method": request.method,
+                "exception_type": type(exc).__name__,
+            },
+            exc_info=_log_tracebacks(),
+        )
     
-    return JSONResponse(
+    return Response(
+        content=_INTERNAL_ERROR_BODY,
         status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-        content=create_error_response(
-            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-            detail="An unexpected error occurred",
-            error_code="INTERNAL_SERVER_ERROR",
-        ),
+        media_type="application/json",
     )
 
 
 def register_exception_handlers(app) -> None:
     """Register all exception handlers with the FastAPI app"""
-    from fastapi.exceptions import RequestValidationError as FastAPIRequestValidationError
-    
-    app.add_exception_handler(HTTPException, http_exception_handler)
-    app.add_exception_handler(FastAPIHTTPException, http_exception_handler)
-    app.add_exception_handler(FastAPIRequestValidationError, validation_exception_handler)
+    # Handler lookup walks the MRO; the Starlette base covers FastAPI's and our
+    # HTTPException as well as router-generated 404/405s
+    app.add_exception_handler(StarletteHTTPException, http_exception_handler)
+    app.add_exception_handler(RequestValidationError, validation_exception_handler)
     app.add_exception_handler(ValidationError, validation_exception_handler)
     app.add_exception_handler(SQLAlchemyError, sqlalchemy_exception_handler)
     app.add_exception_handler(Exception, generic_exception_handler)
\ No newline at end of file
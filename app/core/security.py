@@ -1,18 +1,44 @@
-from datetime import datetime, timedelta
-from typing import Optional, Dict, Any
-from jose import JWTError, jwt
+from collections import OrderedDict
+from datetime import timedelta
+from typing import Optional, Dict, Any, Iterable, List, Tuple
+import base64
+import hashlib
+import hmac
+import threading
+import time
+import jwt
+import orjson
+from jwt import ExpiredSignatureError, InvalidTokenError as JWTError
+from anyio import create_task_group, to_thread
 from passlib.context import CryptContext
 from fastapi import HTTPException, status
-import os
 
-# Password hashing context
-pwd_context = CryptContext(schemes=["bcrypt"], deprecated="auto")
+from app.core.config import settings
+from app.core.exceptions import BEARER_HEADERS
 
-# JWT Configuration
-SECRET_KEY = os.getenv("SECRET_KEY", "your-secret-key-change-in-production")
-ALGORITHM = os.getenv("ALGORITHM", "HS256")
-ACCESS_TOKEN_EXPIRE_MINUTES = int(os.getenv("ACCESS_TOKEN_EXPIRE_MINUTES", "30"))
-REFRESH_TOKEN_EXPIRE_DAYS = int(os.getenv("REFRESH_TOKEN_EXPIRE_DAYS", "7"))
+# Password hashing context (bcrypt cost is tunable per deployment)
+pwd_context = CryptContext(
+    schemes=["bcrypt"],
+    deprecated="auto",
+    bcrypt__rounds=settings.PASSWORD_HASH_ROUNDS,
+)
+
+# JWT Configuration (read from the cached settings instance)
+SECRET_KEY = settings.SECRET_KEY
+ALGORITHM = settings.ALGORITHM
+ACCESS_TOKEN_EXPIRE_MINUTES = settings.ACCESS_TOKEN_EXPIRE_MINUTES
+REFRESH_TOKEN_EXPIRE_DAYS = settings.REFRESH_TOKEN_EXPIRE_DAYS
+
+# Derived once instead of per token
+ACCESS_TOKEN_EXPIRE_SECONDS = ACCESS_TOKEN_EXPIRE_MINUTES * 60
+REFRESH_TOKEN_EXPIRE_SECONDS = REFRESH_TOKEN_EXPIRE_DAYS * 86400
+_ALGORITHMS = [ALGORITHM]
+
+# Verified token payloads keyed by a digest of the token (FIFO eviction)
+TOKEN_CACHE_MAXSIZE = 10_000
+TOKEN_CACHE_TTL = 60
+_token_cache: "OrderedDict[bytes, Tuple[float, Dict[str, Any]]]" = OrderedDict()
+_token_cache_lock = threading.Lock()
 
 
 def verify_password(plain_password: str, hashed_password: str) -> bool:
@@ -42,6 +68,120 @@ def get_password_hash(password: str) -> str:
     return pwd_context.hash(password)
 
 
+async def verify_password_async(plain_password: str, hashed_password: str) -> bool:
+    """
+    Verify a password in a worker thread so bcrypt does not block the event loop.
+    
+    Args:
+        plain_password: The plain text password
+        hashed_password: The hashed password to compare against
+        
+    Returns:
+        bool: True if password matches, False otherwise
+    """
+    return await to_thread.run_sync(pwd_context.verify, plain_password, hashed_password)
+
+
+async def verify_many(pairs: Iterable[Tuple[str, str]]) -> List[bool]:
+    """
+    Verify several (plain_password, hashed_password) pairs concurrently.
+    
+    Args:
+        pairs: Iterable of (plain_password, hashed_password) tuples
+        
+    Returns:
+        List[bool]: Match results in the same order as pairs
+        
+    Raises:
+        ValueError: Like verify_password, if a hash is malformed. Every pair
+            is still checked; the error of the first failing pair (in input
+            order) is raised as-is, never wrapped in an ExceptionGroup.
+    """
+    pairs = list(pairs)
+    results: List[bool] = [False] * len(pairs)
+    errors: List[Optional[Exception]] = [None] * len(pairs)
+    
+    async def _verify(index: int, plain: str, hashed: str) -> None:
+        try:
+            results[index] = await verify_password_async(plain, hashed)
+        except Exception as exc:
+            errors[index] = exc
+    
+    async with create_task_group() as task_group:
+        for index, (plain, hashed) in enumerate(pairs):
+            task_group.start_soon(_verify, index, plain, hashed)
+    
+    for error in errors:
+        if error is not None:
+            raise error
+    
+    return results
+
+
+def _b64url(data: bytes) -> bytes:
+    """Base64url-encode without padding, as JWS requires"""
+    return base64.urlsafe_b64encode(data).rstrip(b"=")
+
+
+# HS256 signing reuses one keyed HMAC state instead of re-keying per token
+_HS256_HEADER = _b64url(orjson.dumps({"alg": "HS256", "typ": "JWT"}))
+_HMAC_TEMPLATE = hmac.new(SECRET_KEY.encode(), digestmod=hashlib.sha256)
+
+
+# Claim value types the HS256 fast path serializes exactly as PyJWT would
+_PLAIN_CLAIM_TYPES = (str, int, bool, type(None))
+
+
+def _encode_token(claims: Dict[str, Any]) -> str:
+    """
+    Encode and sign a JWT.
+    
+    HS256 tokens whose claims are flat str keys with str/int/bool/None values
+    are signed directly from the precomputed HMAC template. Anything else
+    (other algorithms, nested or non-JSON values such as datetime or UUID,
+    non-str keys) goes through jwt.encode, so callers get PyJWT's behaviour
+    and errors unchanged.
+    
+    Args:
+        claims: Claims to encode (exp/iat as epoch seconds)
+        
+    Returns:
+        str: Encoded JWT token
+    """
+    if ALGORITHM != "HS256" or not all(
+        type(key) is str and type(value) in _PLAIN_CLAIM_TYPES
+        for key, value in claims.items()
+    ):
+        return jwt.encode(claims, SECRET_KEY, algorithm=ALGORITHM)
+    
+    signing_input = _HS256_HEADER + b"." + _b64url(orjson.dumps(claims))
+    mac = _HMAC_TEMPLATE.copy()
+    mac.update(signing_input)
+    return (signing_input + b"." + _b64url(mac.digest())).decode("ascii")
+
+
+def _check_hs256_encoder() -> None:
+    """
+    Round-trip a token from the HS256 fast path through PyJWT's verifier.
+    
+    Raises:
+        RuntimeError: If PyJWT does not accept the token or its claims
+    """
+    now = int(time.time())
+    claims = {"sub": "0", "exp": now + 60, "iat": now, "type": "access"}
+    try:
+        decoded = jwt.decode(_encode_token(claims), SECRET_KEY, algorithms=["HS256"])
+    except JWTError as exc:
+        raise RuntimeError(f"HS256 token encoder is not PyJWT-compatible: {exc}") from exc
+    if decoded != claims:
+        raise RuntimeError("HS256 token encoder does not round-trip its claims")
+
+
+# Checked once at import so an incompatible signer never issues tokens
+if ALGORITHM == "HS256":
+    _check_hs256_encoder()
+
+
 def create_access_token(
     data: Dict[str, Any],
     expires_delta: Optional[timedelta] = None
@@ -56,20 +196,16 @@ def create_access_token(
     Returns:
         str: Encoded JWT token
     """
-    to_encode = data.copy()
-    
+    # JWT exp/iat are plain epoch seconds (RFC 7519 NumericDate)
+    now = int(time.time())
     if expires_delta:
-        expire = datetime.utcnow() + expires_delta
+        expire = now + int(expires_delta.total_seconds())
     else:
-        expire = datetime.utcnow() + timedelta(minutes=ACCESS_TOKEN_EXPIRE_MINUTES)
+        expire = now + ACCESS_TOKEN_EXPIRE_SECONDS
     
-    to_encode.update({
-        "exp": expire,
-        "iat": datetime.utcnow(),
-        "type": "access"
-    })
+    to_encode = {**data, "exp": expire, "iat": now, "type": "access"}
     
-    encoded_jwt = jwt.encode(to_encode, SECRET_KEY, algorithm=ALGORITHM)
+    encoded_jwt = _encode_token(to_encode)
     return encoded_jwt
 
 
@@ -87,23 +223,77 @@ def create_refresh_token(
     Returns:
         str: Encoded JWT refresh token
     """
-    to_encode = data.copy()
-    
+    # JWT exp/iat are plain epoch seconds (RFC 7519 NumericDate)
+    now = int(time.time())
     if expires_delta:
-        expire = datetime.utcnow() + expires_delta
+        expire = now + int(expires_delta.total_seconds())
     else:
-        expire = datetime.utcnow() + timedelta(days=REFRESH_TOKEN_EXPIRE_DAYS)
+        expire = now + REFRESH_TOKEN_EXPIRE_SECONDS
     
-    to_encode.update({
-        "exp": expire,
-        "iat": datetime.utcnow(),
-        "type": "refresh"
-    })
+    to_encode = {**data, "exp": expire, "iat": now, "type": "refresh"}
     
-    encoded_jwt = jwt.encode(to_encode, SECRET_KEY, algorithm=ALGORITHM)
+    encoded_jwt = _encode_token(to_encode)
     return encoded_jwt
 
 
+def credentials_exception(detail: str = "Could not validate credentials") -> HTTPException:
+    """
+    Build a 401 error for a rejected token.
+    
+    Args:
+        detail: Error message for the response
+        
+    Returns:
+        HTTPException: 401 exception with the Bearer challenge header
+    """
+    return HTTPException(
+        status_code=status.HTTP_401_UNAUTHORIZED,
+        detail=detail,
+        headers=BEARER_HEADERS,
+    )
+
+
+def _decode_verified(token: str) -> Dict[str, Any]:
+    """
+    Verify and decode a JWT, reusing payloads verified in the last TOKEN_CACHE_TTL seconds.
+    
+    Args:
+        token: The JWT token to verify
+        
+    Returns:
+        Dict[str, Any]: Decoded token payload
+        
+    Raises:
+        JWTError: If token is invalid or expired
+    """
+    key = hashlib.blake2b(token.encode(), digest_size=16).digest()
+    now = time.time()
+    
+    cached = _token_cache.get(key)
+    if cached is not None:
+        cached_at, payload = cached
+        if now - cached_at < TOKEN_CACHE_TTL and payload["exp"] > now:
+            return dict(payload)
+        with _token_cache_lock:
+            _token_cache.pop(key, None)
+    
+    # PyJWT checks the signature, exp and the required claims
+    payload = jwt.decode(
+        token,
+        SECRET_KEY,
+        algorithms=_ALGORITHMS,
+        options={"require": ["exp", "type"]},
+    )
+    
+    with _token_cache_lock:
+        _token_cache[key] = (now, payload)
+        if len(_token_cache) > TOKEN_CACHE_MAXSIZE:
+            _token_cache.popitem(last=False)
+    
+    # Callers get their own copy so the cached payload cannot be mutated
+    return dict(payload)
+
+
 def verify_token(token: str, token_type: str = "access") -> Dict[str, Any]:
     """
     Verify and decode a JWT token.
@@ -118,39 +308,18 @@ def verify_token(token: str, token_type: str = "access") -> Dict[str, Any]:
     Raises:
         HTTPException: If token is invalid, expired, or wrong type
     """
-    credentials_exception = HTTPException(
-        status_code=status.HTTP_401_UNAUTHORIZED,
-        detail="Could not validate credentials",
-        headers={"WWW-Authenticate": "Bearer"},
-    )
-    
     try:
-        payload = jwt.decode(token, SECRET_KEY, algorithms=[ALGORITHM])
-        
-        # Verify token type
-        if payload.get("type") != token_type:
-            raise HTTPException(
-                status_code=status.HTTP_401_UNAUTHORIZED,
-                detail=f"Invalid token type. Expected {token_type}",
-                headers={"WWW-Authenticate": "Bearer"},
-            )
-        
-        # Check expiration
-        exp = payload.get("exp")
-        if exp is None:
-            raise credentials_exception
-        
-        if datetime.utcnow() > datetime.fromtimestamp(exp):
-            raise HTTPException(
-                status_code=status.HTTP_401_UNAUTHORIZED,
-                detail="Token has expired",
-                headers={"WWW-Authenticate": "Bearer"},
-            )
-        
-        return payload
-        
+        payload = _decode_verified(token)
+    except ExpiredSignatureError:
+        raise credentials_exception("Token has expired")
     except JWTError:
-        raise credentials_exception
+        raise credentials_exception()
+    
+    # Verify token type
+    if payload["type"] != token_type:
+        raise credentials_exception(f"Invalid token type. Expected {token_type}")
+    
+    return payload
 
 
 def decode_token(token: str) -> Optional[Dict[str, Any]]:
@@ -167,8 +336,10 @@ def decode_token(token: str) -> Optional[Dict[str, Any]]:
         payload = jwt.decode(
             token,
             SECRET_KEY,
-            algorithms=[ALGORITHM],
-            options={"verify_signature": False}
+            algorithms=_ALGORITHMS,
+            # PyJWT skips every claim check without a signature check;
+            # keep rejecting expired tokens as python-jose did
+            options={"verify_signature": False, "verify_exp": True}
         )
         return payload
     except JWTError:
@@ -211,8 +382,16 @@ def create_token_pair(data: Dict[str, Any]) -> Dict[str, str]:
     Returns:
         Dict[str, str]: Dictionary with access_token and refresh_token
     """
-    access_token = create_access_token(data)
-    refresh_token = create_refresh_token(data)
+    # Both tokens share one timestamp and base claim set
+    now = int(time.time())
+    base = {**data, "iat": now}
+    
+    access_token = _encode_token(
+        {**base, "exp": now + ACCESS_TOKEN_EXPIRE_SECONDS, "type": "access"}
+    )
+    refresh_token = _encode_token(
+        {**base, "exp": now + REFRESH_TOKEN_EXPIRE_SECONDS, "type": "refresh"}
+    )
     
     return {
         "access_token": access_token,
@@ -0,0 +1,42 @@
+"""
+Freeze the .env file into app/core/_env_frozen.py.
+
+Run at container start (before the workers boot) so worker processes load
+settings from a bytecode-cached dict literal instead of parsing .env on
+every start:
+
+    python scripts/freeze_env.py [path/to/.env]
+
+The output is a plaintext copy of .env, secrets included. It is gitignored
+and dockerignored; never bake it into an image layer. Settings ignores it
+once .env is newer than the snapshot.
+"""
+import sys
+from pathlib import Path
+
+from dotenv import dotenv_values
+
+ROOT = Path(__file__).resolve().parent.parent
+OUTPUT = ROOT / "app" / "core" / "_env_frozen.py"
+
+
+def freeze_env(env_file: Path, output: Path = OUTPUT) -> None:
+    """Write the key/value pairs of env_file as a module-level ENV dict"""
+    env = {key: value for key, value in dotenv_values(env_file).items() if value is not None}
+    
+    lines = [
+        "# Generated by scripts/freeze_env.py - do not edit or commit.",
+        "ENV = {",
+    ]
+    lines.extend(f"    {key!r}: {value!r}," for key, value in sorted(env.items()))
+    lines.append("}")
+    
+    output.write_text("\n".join(lines) + "\n", encoding="utf-8")
+
+
+if __name__ == "__main__":
+    env_file = Path(sys.argv[1]) if len(sys.argv) > 1 else ROOT / ".env"
+    if not env_file.is_file():
+        sys.exit(f"{env_file} not found")
+    freeze_env(env_file)
+    print(f"Wrote {OUTPUT.relative_to(ROOT)}")